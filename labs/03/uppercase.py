@@ -43,11 +43,17 @@ class BatchGenerator:
         return (len(self._inputs) + self._batch_size - 1) // self._batch_size
 
     def __iter__(self):
-        indices = torch.randperm(len(self._inputs)) if self._shuffle else torch.arange(len(self._inputs))
-        while len(indices):
-            batch = indices[:self._batch_size]
-            indices = indices[self._batch_size:]
-            yield self._inputs[batch], self._outputs[batch]
+        if self._shuffle:
+            indices = torch.randperm(len(self._inputs))
+            for start in range(0, len(indices), self._batch_size):
+                batch = indices[start:start + self._batch_size]
+                yield self._inputs[batch], self._outputs[batch]
+        else:
+            # Without shuffling, the batches are slices of the data; they are cloned into contiguous tensors,
+            # because the inputs might be overlapping views (e.g., `windows`) that must not be shared with the model.
+            for start in range(0, len(self._inputs), self._batch_size):
+                yield (self._inputs[start:start + self._batch_size].clone(memory_format=torch.contiguous_format),
+                       self._outputs[start:start + self._batch_size].clone(memory_format=torch.contiguous_format))
 
 
 class Model(npfl138.TrainableModule):
@@ -65,19 +65,10 @@ def main(args: argparse.Namespace) -> None:
         # TODO: Perform the prediction on the test data. The line below assumes you have
         # a dataloader `test` where the individual examples are `(image, target)` pairs.
         for mask in model.predict(test, data_with_labels=True):
-            zeros, ones, runs = 0, 0, []
-            for pixel in np.reshape(mask >= 0.5, [-1]):
-                if pixel:
-                    if zeros or (not zeros and not ones):
-                        runs.append(zeros)
-                        zeros = 0
-                    ones += 1
-                else:
-                    if ones:
-                        runs.append(ones)
-                        ones = 0
-                    zeros += 1
-            runs.append(zeros + ones)
+            # Encode the mask as lengths of alternating runs of zeros and ones, starting with zeros.
+            pixels = np.reshape(mask >= 0.5, [-1])
+            changes = np.flatnonzero(np.diff(pixels, prepend=False))
+            runs = np.diff(changes, prepend=0, append=len(pixels))
             print(*runs, file=predictions_file)
 
 
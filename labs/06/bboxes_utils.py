@@ -38,14 +38,13 @@ def bboxes_iou(xs: torch.Tensor, ys: torch.Tensor) -> torch.Tensor:
     shape `[num_xs, num_ys]`, computing IoU for all pairs of bboxes from `xs` and `ys`.
     Formally, the output shape is `torch.broadcast_shapes(xs.shape, ys.shape)[:-1]`.
     """
-    intersections = torch.stack([
-        torch.maximum(xs[..., TOP], ys[..., TOP]),
-        torch.maximum(xs[..., LEFT], ys[..., LEFT]),
-        torch.minimum(xs[..., BOTTOM], ys[..., BOTTOM]),
-        torch.minimum(xs[..., RIGHT], ys[..., RIGHT]),
-    ], dim=-1)
-
-    xs_area, ys_area, intersections_area = bboxes_area(xs), bboxes_area(ys), bboxes_area(intersections)
+    # The intersection area is computed directly from the coordinates, without materializing the intersection bboxes.
+    intersections_area = torch.relu(
+        torch.minimum(xs[..., BOTTOM], ys[..., BOTTOM]) - torch.maximum(xs[..., TOP], ys[..., TOP])
+    ) * torch.relu(
+        torch.minimum(xs[..., RIGHT], ys[..., RIGHT]) - torch.maximum(xs[..., LEFT], ys[..., LEFT])
+    )
+    xs_area, ys_area = bboxes_area(xs), bboxes_area(ys)
 
     return intersections_area / (xs_area + ys_area - intersections_area)
 
@@ -27,7 +27,9 @@ class CIFAR10:
     class Dataset(torch.utils.data.Dataset):
         def __init__(self, data: "CIFAR10.Elements") -> None:
             self._data = {key: torch.as_tensor(value) for key, value in data.items()}
-            self._data["images"] = self._data["images"].moveaxis(-1, 1)
+            # Store the images channels-first contiguously, so that both the individual examples
+            # and the whole `data["images"]` can be used without a strided copy.
+            self._data["images"] = self._data["images"].moveaxis(-1, 1).contiguous()
             self._data["labels"] = self._data["labels"].view(-1)
 
         @property
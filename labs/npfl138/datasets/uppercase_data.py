@@ -21,9 +21,13 @@
     - `text`: the original text (of course lowercased in case of the test set)
     - `alphabet`: an alphabet used by `windows`
     - `windows`: a torch Tensor with shape `[size, 2 * window + 1]` containing
-      windows with indices of input lowercased characters
+      windows with indices of input lowercased characters; the indices have
+      the `window_dtype` type, `torch.int64` by default; `torch.int32` is also
+      supported (e.g., by `torch.nn.Embedding`), but `torch.nn.functional.one_hot`
+      requires `torch.int64`
     - `labels`: a torch Tensor with shape `[size]` containing 0/1 for lower/uppercase
 """
+import collections
 import os
 import sys
 from typing import TextIO
@@ -40,7 +44,13 @@ class UppercaseData:
     _URL: str = "https://ufal.mff.cuni.cz/~straka/courses/npfl138/2425/datasets/uppercase_data.zip"
 
     class Dataset:
-        def __init__(self, data: str, window: int, alphabet: int | list[str], label_dtype: torch.dtype) -> None:
+        def __init__(
+            self, data: str, window: int, alphabet: int | list[str], label_dtype: torch.dtype,
+            window_dtype: torch.dtype = torch.int64,
+        ) -> None:
+            if window_dtype not in (torch.int32, torch.int64):
+                raise ValueError("UppercaseData: The window_dtype must be torch.int32 or torch.int64, not {}.".format(
+                    window_dtype))
             self._window = window
             self._text = data
             self._size = len(data)
@@ -59,28 +69,27 @@ class UppercaseData:
                         raise ValueError("UppercaseData: Duplicated character '{}' in the alphabet.".format(letter))
                     alphabet_map[letter] = index
             else:
-                # Find most frequent characters
-                freqs = {}
-                for char in self._text.lower():
-                    freqs[char] = freqs.get(char, 0) + 1
-
-                most_frequent = sorted(freqs.items(), key=lambda item: item[1], reverse=True)
+                # Find most frequent characters; the `most_common` sort is stable, so ties
+                # keep the order of the first occurrence in the text.
+                most_frequent = collections.Counter(self._text.lower()).most_common()
                 for i, (char, freq) in enumerate(most_frequent, len(alphabet_map)):
                     alphabet_map[char] = i
                     if alphabet and len(alphabet_map) >= alphabet:
                         break
 
-            # Remap lowercased input characters using the alphabet_map and create labels
+            # Remap lowercased input characters using the alphabet_map and create labels;
+            # every distinct character is processed only once and the results are then gathered.
+            chars, char_indices = np.unique(
+                np.frombuffer(self._text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32), return_inverse=True)
+            chars = [chr(char) for char in chars]
+            char_ids = np.array([alphabet_map.get(char.lower(), alphabet_map["<unk>"]) for char in chars], np.int64)
+            char_labels = np.array([char.isupper() for char in chars], dtype=np.float32)
+
             lcletters = np.zeros(self._size + 2 * window, dtype=np.int64)
-            labels = np.zeros(self._size, dtype=np.float32)
-            for i in range(self._size):
-                char = self._text[i].lower()
-                if char not in alphabet_map:
-                    char = "<unk>"
-                lcletters[i + window] = alphabet_map[char]
-                labels[i] = self._text[i].isupper()
-
-            self._windows = torch.from_numpy(lcletters).unfold(0, 2 * window + 1, 1)
+            lcletters[window:window + self._size] = char_ids[char_indices]
+            labels = char_labels[char_indices]
+
+            self._windows = torch.from_numpy(lcletters).to(dtype=window_dtype).unfold(0, 2 * window + 1, 1)
             self._labels = torch.from_numpy(labels).to(dtype=label_dtype)
 
             # Compute alphabet
@@ -108,7 +117,10 @@ class UppercaseData:
         def labels(self) -> torch.Tensor:
             return self._labels
 
-    def __init__(self, window: int, alphabet_size: int = 0, label_dtype: torch.dtype = torch.float32) -> None:
+    def __init__(
+        self, window: int, alphabet_size: int = 0, label_dtype: torch.dtype = torch.float32,
+        window_dtype: torch.dtype = torch.int64,
+    ) -> None:
         path = os.path.basename(self._URL)
         if not os.path.exists(path):
             print("Downloading dataset {}...".format(path), file=sys.stderr)
@@ -124,6 +136,7 @@ class UppercaseData:
                     window,
                     alphabet=alphabet_size if dataset == "train" else self.train.alphabet,
                     label_dtype=label_dtype,
+                    window_dtype=window_dtype,
                 ))
 
     train: Dataset
@@ -139,16 +152,19 @@ class UppercaseData:
             raise RuntimeError("The predictions are shorter than gold data: {} vs {}.".format(
                 len(predictions), len(gold)))
 
-        correct = 0
-        for i in range(len(gold)):
+        # Compare all code points at once; only the differing positions need to be validated.
+        gold_chars = np.frombuffer(gold.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+        predicted_chars = np.frombuffer(predictions[:len(gold)].encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+        differences = np.flatnonzero(gold_chars != predicted_chars)
+
+        for i in differences:
             # Note that just the lower() condition is not enough, for example
             # u03c2 and u03c3 have both u03c2 as an uppercase character.
             if predictions[i].lower() != gold[i].lower() and predictions[i].upper() != gold[i].upper():
                 raise RuntimeError("The predictions and gold data differ on position {}: {} vs {}.".format(
                     i, repr(predictions[i:i + 20].lower()), repr(gold[i:i + 20].lower())))
 
-            correct += gold[i] == predictions[i]
-        return 100 * correct / len(gold)
+        return 100 * (len(gold) - len(differences)) / len(gold)
 
     @staticmethod
     def evaluate_file(gold_dataset: Dataset, predictions_file: TextIO) -> float:
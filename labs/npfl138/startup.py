@@ -10,13 +10,19 @@ import numpy as np
 import torch
 
 
-def startup(seed: int | None = None, threads: int | None = None, forkserver_instead_of_fork: bool = False) -> None:
+def startup(
+    seed: int | None = None,
+    threads: int | None = None,
+    forkserver_instead_of_fork: bool = False,
+    cudnn_benchmark: bool = False,
+) -> None:
     """Initialize the environment.
 
     - Allow using TF32 for matrix multiplication.
     - Set the random seed if given.
     - Set the number of threads if given.
     - Use `forkserver` instead of `fork` if requested.
+    - Enable cuDNN benchmarking if requested.
 
     Parameters:
       seed: If not `None`, set the Python, Numpy, and PyTorch random seeds to this value.
@@ -24,6 +30,9 @@ def startup(seed: int | None = None, threads: int | None = None, forkserver_inst
         Otherwise, use as many threads as cores.
       forkserver_instead_of_fork: If `True`, use `forkserver` instead of `fork` as the
         default multiprocessing method. This will be the default in Python 3.14.
+      cudnn_benchmark: If `True`, let cuDNN benchmark the available convolution algorithms
+        for every new input shape and use the fastest one; beneficial when the input shapes
+        are fixed, but the selected algorithms might be nondeterministic.
     """
 
     # Allow TF32 when available.
@@ -50,3 +59,7 @@ def startup(seed: int | None = None, threads: int | None = None, forkserver_inst
         elif forkserver_instead_of_fork or os.environ.get("FORCE_FORKSERVER_METHOD") == "1":
             if torch.multiprocessing.get_start_method(allow_none=True) != "forkserver":
                 torch.multiprocessing.set_start_method("forkserver")
+
+    # If instructed, let cuDNN select the fastest convolution algorithms by benchmarking them.
+    if cudnn_benchmark:
+        torch.backends.cudnn.benchmark = True
@@ -109,10 +109,23 @@ def is_sequence(x: TensorOrTensors) -> bool:
     return isinstance(x, list) or (isinstance(x, tuple) and not isinstance(x, torch.nn.utils.rnn.PackedSequence))
 
 
+def to_numpy(x: torch.Tensor) -> np.ndarray:
+    # NumPy does not support bfloat16, which is produced for example by autocasting.
+    return (x.float() if x.dtype == torch.bfloat16 else x).numpy(force=True)
+
+
 def maybe_unpack(x: Tensor, as_numpy: bool) -> Tensor | np.ndarray | list[Tensor] | list[np.ndarray]:
     if isinstance(x, torch.nn.utils.rnn.PackedSequence):
-        return [y.numpy(force=True) if as_numpy else y for y in torch.nn.utils.rnn.unpack_sequence(x)]
-    return x.numpy(force=True) if as_numpy else x
+        return [to_numpy(y) if as_numpy else y for y in torch.nn.utils.rnn.unpack_sequence(x)]
+    return to_numpy(x) if as_numpy else x
+
+
+def to_device(x: TensorOrTensors, device: torch.device) -> TensorOrTensors:
+    # With pinned source tensors, the non-blocking copies are only enqueued, so the host does not wait for them
+    # and can prepare further work; the copies still run on the current stream in order with the kernels.
+    if is_sequence(x):
+        return tuple(x_.to(device, non_blocking=True) for x_ in x)
+    return x.to(device, non_blocking=True)
 
 
 def check_tensor(x: Tensor) -> bool:
@@ -219,6 +232,7 @@ class TrainableModule(torch.nn.Module):
         initial_epoch: int | KeepPrevious = keep_previous,
         logdir: str | None | KeepPrevious = keep_previous,
         device: torch.device | str | Literal["auto"] | KeepPrevious = keep_previous,
+        autocast: torch.dtype | None | KeepPrevious = keep_previous,
     ) -> Self:
         """Configure the module fitting, evaluation, and placement.
 
@@ -240,6 +254,12 @@ class TrainableModule(torch.nn.Module):
           logdir: An optional directory where textual and TensorBoard logs should be stored.
           device: The device to move the module to. When "auto", or `keep_previous`
             with no previously set device, the first of cuda/mps/xpu is used if available.
+          autocast: An optional dtype (e.g., `torch.bfloat16`) used by [torch.autocast][]
+            during the forward pass and the loss computation in training, evaluation,
+            and prediction; `None` disables autocasting. When `torch.float16` is used,
+            the training loss is scaled by a [torch.amp.GradScaler][] to avoid gradient underflow.
+            Both are performed only by the default `train_step`, `test_step`, and `predict_step`;
+            overriding methods not calling them must use `autocast_context()` and `grad_scaler` themselves.
 
         Returns:
           self
@@ -254,11 +274,19 @@ class TrainableModule(torch.nn.Module):
         if logdir is not keep_previous and logdir != self.logdir:  # reset loggers on a new logdir
             self._log_file, self._tb_writers = None, {}
         self.logdir = logdir if logdir is not keep_previous else self.logdir
+        previous_autocast, previous_device = self.autocast, self.device
+        self.autocast = autocast if autocast is not keep_previous else self.autocast
         if device is not keep_previous or not self.device:
             self.device = get_auto_device() if device == "auto" or device is keep_previous else torch.device(device)
         self.to(self.device)
+        self._update_grad_scaler(previous_autocast, previous_device)
         return self
 
+    def _update_grad_scaler(self, previous_autocast: torch.dtype | None, previous_device: torch.device | None) -> None:
+        # Keep the current loss scale and its growth tracking unless the autocasting or the device changes.
+        if self.grad_scaler is None or self.autocast != previous_autocast or self.device != previous_device:
+            self.grad_scaler = torch.amp.GradScaler(self.device.type, enabled=self.autocast == torch.float16)
+
     def unconfigure(self) -> Self:
         """Remove all training configuration of the TrainableModule.
 
@@ -270,6 +298,7 @@ class TrainableModule(torch.nn.Module):
         self.optimizer, self.scheduler, self.epoch = None, None, None
         self.loss, self.loss_tracker, self.metrics = None, None, None
         self.logdir, self._log_file, self._tb_writers = None, None, None
+        self.autocast, self.grad_scaler = None, None
         return self
 
     def fit(
@@ -320,11 +349,13 @@ class TrainableModule(torch.nn.Module):
                 dataloader, epoch_message, unit="batch", leave=False, disable=None if console == 2 else console < 2)
             for batch in data_and_progress:
                 xs, y = validate_batch_input_output(batch)
-                xs = tuple(x.to(self.device) for x in (xs if is_sequence(xs) else (xs,)))
-                y = tuple(y_.to(self.device) for y_ in y) if is_sequence(y) else y.to(self.device)
+                xs = to_device(xs if is_sequence(xs) else (xs,), self.device)
+                y = to_device(y, self.device)
                 log_graph = log_graph and self.log_graph(xs) and False
                 logs = self.train_step(xs, y)
-                if not data_and_progress.disable:
+                # Formatting the logs synchronizes with the device, so do it only when the progress bar gets redrawn.
+                if not data_and_progress.disable \
+                        and time.time() - data_and_progress.last_print_t >= data_and_progress.mininterval:
                     logs_message = " ".join([f"{k}={v:#.{0<abs(v)<2e-4 and '2e' or '4f'}}" for k, v in logs.items()])
                     data_and_progress.set_description(f"{epoch_message} {logs_message}", refresh=False)
             logs = {f"train_{k}": v for k, v in logs.items()}
@@ -347,11 +378,13 @@ class TrainableModule(torch.nn.Module):
           logs: A dictionary of logs from the training step.
         """
         self.optimizer.zero_grad()
-        y_pred = self(*xs)
-        loss = self.compute_loss(y_pred, y, *xs)
-        loss.backward()
+        with self.autocast_context():
+            y_pred = self(*xs)
+            loss = self.compute_loss(y_pred, y, *xs)
+        self.grad_scaler.scale(loss).backward()
         with torch.no_grad():
-            self.optimizer.step()
+            self.grad_scaler.step(self.optimizer)
+            self.grad_scaler.update()
             self.scheduler is not None and self.scheduler.step()
             return {"loss": self.loss_tracker(loss)} \
                 | ({"lr": self.scheduler.get_last_lr()[0]} if self.scheduler else {}) \
@@ -413,8 +446,8 @@ class TrainableModule(torch.nn.Module):
         start = time.time()
         for batch in dataloader:
             xs, y = validate_batch_input_output(batch)
-            xs = tuple(x.to(self.device) for x in (xs if is_sequence(xs) else (xs,)))
-            y = tuple(y_.to(self.device) for y_ in y) if is_sequence(y) else y.to(self.device)
+            xs = to_device(xs if is_sequence(xs) else (xs,), self.device)
+            y = to_device(y, self.device)
             logs = self.test_step(xs, y)
         if log_as is not None:
             logs = {f"{log_as}_{k}": v for k, v in logs.items()}
@@ -434,7 +467,7 @@ class TrainableModule(torch.nn.Module):
         Returns:
           logs: A dictionary of logs from the evaluation step.
         """
-        with torch.no_grad():
+        with torch.no_grad(), self.autocast_context():
             y_pred = self(*xs)
             loss = self.compute_loss(y_pred, y, *xs)
             return {"loss": self.loss_tracker(loss)} | self.compute_metrics(y_pred, y, *xs)
@@ -467,7 +500,7 @@ class TrainableModule(torch.nn.Module):
         predictions = []
         for batch in dataloader:
             xs = validate_batch_input(batch, with_labels=data_with_labels)
-            xs = tuple(x.to(self.device) for x in (xs if is_sequence(xs) else (xs,)))
+            xs = to_device(xs if is_sequence(xs) else (xs,), self.device)
             y = self.predict_step(xs, as_numpy=as_numpy)
             predictions.extend(y if not isinstance(y, tuple) else zip(*y))
         return predictions
@@ -484,17 +517,25 @@ class TrainableModule(torch.nn.Module):
         Returns:
           predictions: The batch prediction.
         """
-        with torch.no_grad():
+        with torch.no_grad(), self.autocast_context():
             y = self(*xs)
             return maybe_unpack(y, as_numpy) if not is_sequence(y) else tuple(maybe_unpack(y_, as_numpy) for y_ in y)
 
+    def autocast_context(self) -> torch.autocast:
+        """Return a [torch.autocast][] context manager for the configured `autocast` dtype.
+
+        When no `autocast` dtype has been configured, the returned context manager is disabled.
+        """
+        return torch.autocast(self.device.type, dtype=self.autocast, enabled=self.autocast is not None)
+
     def save_weights(self, path: str, optimizer_path: str | None = None) -> Self:
         """Save the model weights to the given path.
 
         Parameters:
           path: The path to save the model weights to; a `.pt` extension is recommended.
           optimizer_path: An optional path to save the optimizer state to, relative to the
-            model weights path.
+            model weights path; the epoch, the scheduler state, and the float16 loss scaling
+            state are saved there too.
 
         Returns:
           self
@@ -503,11 +544,13 @@ class TrainableModule(torch.nn.Module):
         os.path.dirname(path) and os.makedirs(os.path.dirname(path), exist_ok=True)
         torch.save(state_dict, path)
 
-        # Save the number of epochs, optimizer state, and the scheduler state when requested.
+        # Save the number of epochs, optimizer state, the scheduler state, and the loss scaling when requested.
         if optimizer_path is not None:
             optimizer_state = {"epoch": self.epoch}
             self.optimizer is not None and optimizer_state.update(optimizer=self.optimizer.state_dict())
             self.scheduler is not None and optimizer_state.update(scheduler=self.scheduler.state_dict())
+            self.grad_scaler is not None and self.grad_scaler.is_enabled() \
+                and optimizer_state.update(grad_scaler=self.grad_scaler.state_dict())
             optimizer_path = os.path.join(os.path.dirname(path), optimizer_path)
             os.path.dirname(optimizer_path) and os.makedirs(os.path.dirname(optimizer_path), exist_ok=True)
             torch.save(optimizer_state, optimizer_path)
@@ -520,18 +563,21 @@ class TrainableModule(torch.nn.Module):
         Parameters:
           path: The path to load the model weights from.
           optimizer_path: An optional path to load the optimizer state from, relative to the
-            model weights path.
+            model weights path; the epoch, the scheduler state, and the float16 loss scaling
+            state are loaded from there too.
           device: The device to load the model to; when "auto", or `keep_previous` with no previously
             set device, the first of cuda/mps/xpu is used if available.
 
         Returns:
           self
         """
+        previous_device = self.device
         if device is not keep_previous or not self.device:
             self.device = get_auto_device() if device == "auto" or device is keep_previous else torch.device(device)
+        self._update_grad_scaler(self.autocast, previous_device)
         self.load_state_dict(torch.load(path, map_location=self.device))
 
-        # Load the number of epochs, optimizer state, and the scheduler state when requested.
+        # Load the number of epochs, optimizer state, the scheduler state, and the loss scaling when requested.
         if optimizer_path is not None:
             optimizer_path = os.path.join(os.path.dirname(path), optimizer_path)
             optimizer_state = torch.load(optimizer_path, map_location=self.device)
@@ -546,6 +592,12 @@ class TrainableModule(torch.nn.Module):
                 self.scheduler.load_state_dict(optimizer_state["scheduler"])
             else:
                 assert "scheduler" not in optimizer_state, "The scheduler state is present, but there is no scheduler."
+            if self.grad_scaler.is_enabled():
+                assert "grad_scaler" in optimizer_state, "The loss scaling state is missing."
+                self.grad_scaler.load_state_dict(optimizer_state["grad_scaler"])
+            else:
+                assert "grad_scaler" not in optimizer_state, \
+                    "The loss scaling state is present, but float16 autocasting is not configured."
         self.to(self.device)
         return self
 
@@ -649,7 +701,7 @@ class TrainableModule(torch.nn.Module):
         if self.logdir is not None:
             batch = next(iter(data)) if isinstance(data, torch.utils.data.DataLoader) else data
             xs = validate_batch_input(batch, with_labels=data_with_labels)
-            xs = tuple(x.to(self.device) for x in (xs if is_sequence(xs) else (xs,)))
+            xs = to_device(xs if is_sequence(xs) else (xs,), self.device)
             writer = self.get_tb_writer("train")
             writer.add_graph(self, xs)
             writer.flush()
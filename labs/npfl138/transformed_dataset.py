@@ -75,6 +75,10 @@ class TransformedDataset(torch.utils.data.Dataset):
           as `generator`. Otherwise, the global random number generator would be used during
           every construction of an iterator, i.e. during every `iter(dataloader)` call.
         - When `num_workers` is greater than 0, `persistent_workers` is set to True.
+        - Unless specified, `pin_memory` defaults to `torch.cuda.is_available()`, so that
+          the batches can be copied to a GPU without blocking the host. Note that the default
+          follows CUDA availability, not the device the model is trained on; pass
+          `pin_memory=False` to avoid pinning the batches when training on a CPU of a CUDA machine.
         - When `collate` or `transform_batch` is set, the `self.collate_fn` is passed as the
           `collate_fn` parameter.
         """
@@ -93,6 +97,9 @@ class TransformedDataset(torch.utils.data.Dataset):
             # By default, set persistent_workers to True, but allow it to be overridden
             kwargs.setdefault("persistent_workers", True)
 
+        # By default, pin the batches in memory whenever CUDA is available, independently of the training device.
+        kwargs.setdefault("pin_memory", torch.cuda.is_available())
+
         if self.collate is not None or self.transform_batch is not None:
             if "collate_fn" in kwargs:
                 raise ValueError("When collate or transform_batch is overridden, collate_fn must not be given.")